@@ -5,7 +5,37 @@ import numpy as np
 import trimesh
 import pyvista as pv
 from datetime import datetime
-from BladeGenerator import Blade3D
+from BladeGenerator import Blade3D, _grid_quads, _quads_to_triangles
+
+
+def _fast_concat(meshes):
+    """
+    Concatenate trimesh meshes in one pass: stack vertices once and shift each
+    mesh's faces by the cumulative vertex count of the meshes before it.
+    """
+    meshes = list(meshes)
+    vs = [m.vertices for m in meshes]
+    fs = [m.faces for m in meshes]
+    offsets = np.cumsum([0] + [len(v) for v in vs[:-1]])
+    return trimesh.Trimesh(
+        vertices=np.concatenate(vs),
+        faces=np.concatenate([f + o for f, o in zip(fs, offsets)]),
+        process=False,
+    )
+
+
+def _z_rotations(angles):
+    """
+    Stack of homogeneous rotation matrices about the z-axis, shape (len(angles), 4, 4).
+    Same matrices as trimesh.transformations.rotation_matrix(angle, [0, 0, 1]),
+    built with one vectorized cos/sin evaluation.
+    """
+    angles = np.asarray(angles, dtype=float)
+    c, s = np.cos(angles), np.sin(angles)
+    rot = np.tile(np.eye(4), (len(angles), 1, 1))
+    rot[:, 0, 0], rot[:, 0, 1] = c, -s
+    rot[:, 1, 0], rot[:, 1, 1] = s, c
+    return rot
 
 
 def assemble_blades_on_cylinder(blade: Blade3D, n_blades: int, radius: float, height: float, z_base: float, as_solid=True):
@@ -16,38 +46,45 @@ def assemble_blades_on_cylinder(blade: Blade3D, n_blades: int, radius: float, he
     cylinder = trimesh.creation.cylinder(radius=radius, height=height, sections=128)
     cylinder.apply_translation([0, 0, z_base + height / 2.0])
 
-    # Generate blade mesh
-    blade_mesh = (
-        blade._generate_solid_from_surfaces("both") if as_solid else blade.to_pyvista_mesh("both")
-    )
+    # Generate blade mesh (the cached solid is only read here, so no copy is needed)
+    blade_mesh = blade._solid("both") if as_solid else blade.to_pyvista_mesh("both")
 
-    # Convert PyVista → trimesh
+    # Convert PyVista → trimesh (surfaces are quads, split them so cells are [3, i, j, k])
     if isinstance(blade_mesh, pv.PolyData):
-        faces = blade_mesh.faces.reshape(-1, 4)[:, 1:]
-        blade_mesh = trimesh.Trimesh(vertices=blade_mesh.points, faces=faces)
-
-    # Store z-coordinates for height check
-    if not hasattr(blade, "z_coords"):
-        z_all = np.concatenate([blade.vertices_upper[:, 2], blade.vertices_lower[:, 2]])
-        blade.z_coords = z_all
-
-    meshes = [cylinder]
+        faces = blade_mesh.triangulate().faces.reshape(-1, 4)[:, 1:]
+        blade_mesh = trimesh.Trimesh(vertices=blade_mesh.points, faces=faces, process=False)
 
-    # Compute blade z-shift so that blade is centered on cylinder
-    z_blade_span = blade.z_coords.max() - blade.z_coords.min()
+    # Compute blade z-shift so that blade is centered on cylinder (z-extent cached by the blade)
+    z_min, z_max = blade.z_extent
+    z_blade_span = z_max - z_min
     if height < z_blade_span:
         raise ValueError(f"Provided cylinder height {height} is less than blade span {z_blade_span}")
-    z_shift = z_base + height / 2.0 - (blade.z_coords.min() + z_blade_span / 2.0)
+    z_shift = z_base + height / 2.0 - (z_min + z_blade_span / 2.0)
 
-    for i in range(n_blades):
-        angle = 2 * np.pi * i / n_blades
-        rot_matrix = trimesh.transformations.rotation_matrix(angle, [0, 0, 1])
-        shifted = blade_mesh.copy()
-        shifted.apply_translation([0, 0, z_shift])
-        shifted.apply_transform(rot_matrix)
-        meshes.append(shifted)
+    # Rotate all blade copies about z in one batched product: (n_blades, 3, 3) x (M, 3)
+    V = blade_mesh.vertices + [0.0, 0.0, z_shift]
+    F = blade_mesh.faces
+    rot = _z_rotations(np.arange(n_blades) * (2 * np.pi / n_blades))
+    blades_vertices = (V @ rot[:, :3, :3].transpose(0, 2, 1)).reshape(-1, 3)
 
-    return trimesh.util.concatenate(meshes)
+    # Each copy's faces are shifted past the preceding copies
+    face_offsets = np.arange(n_blades) * len(V)
+    blades_faces = (F[None, :, :] + face_offsets[:, None, None]).reshape(-1, 3)
+    blades = trimesh.Trimesh(vertices=blades_vertices, faces=blades_faces, process=False)
+
+    return _fast_concat([cylinder, blades])
+
+
+def _grid_vertices(X, Y, Z):
+    """
+    Pack broadcastable coordinate grids into an (n, 3) vertex array.
+    Components are written into one preallocated buffer; the final reshape is a view.
+    """
+    verts = np.empty(np.broadcast_shapes(X.shape, Y.shape, Z.shape) + (3,))
+    verts[..., 0] = X
+    verts[..., 1] = Y
+    verts[..., 2] = Z
+    return verts.reshape(-1, 3)
 
 
 def create_diffuser(shape: str, radius_base: float, radius_top: float, height: float, z_base: float,
@@ -78,47 +115,36 @@ def create_diffuser(shape: str, radius_base: float, radius_top: float, height: f
 
         phi = np.linspace(0, 2 * np.pi, n_phi)
         theta = np.linspace(0, np.pi / 2, n_theta)  # half sphere
-        Phi, Theta = np.meshgrid(phi, theta)
-
-        X = radius_base * np.sin(Theta) * np.cos(Phi)
-        Y = radius_base * np.sin(Theta) * np.sin(Phi)
-
+        # Surface of revolution: tabulate one meridian (r(θ), z(θ)) ...
+        r_profile = radius_base * np.sin(theta)
         if position == "bottom":
             # convex downward: apex at top, base at z_base
-            Z = -radius_base * np.cos(Theta) + z_base + radius_base  # shift so base at z_base
+            z_profile = -radius_base * np.cos(theta) + z_base + radius_base  # shift so base at z_base
         elif position == "top":
             # convex upward: apex at top, base at z_base
-            Z = radius_base * np.cos(Theta) + z_base  # base at z_base
+            z_profile = radius_base * np.cos(theta) + z_base  # base at z_base
         else:
             raise ValueError("position must be 'bottom' or 'top' for hemisphere")
 
-        verts = np.stack([X.flatten(), Y.flatten(), Z.flatten()], axis=-1)
-
-        # Build faces
-        faces = []
-        for i in range(n_theta - 1):
-            for j in range(n_phi - 1):
-                v0 = i * n_phi + j
-                v1 = v0 + 1
-                v2 = (i + 1) * n_phi + j + 1
-                v3 = (i + 1) * n_phi + j
-                faces.append([v0, v1, v2])
-                faces.append([v0, v2, v3])
-            # wrap around for last column
-            v0 = i * n_phi + (n_phi - 1)
-            v1 = i * n_phi
-            v2 = (i + 1) * n_phi
-            v3 = (i + 1) * n_phi + (n_phi - 1)
-            faces.append([v0, v1, v2])
-            faces.append([v0, v2, v3])
-
-        mesh = trimesh.Trimesh(vertices=verts, faces=np.array(faces))
+        # ... and sweep it around z: (n_theta, 1) profile against (1, n_phi) azimuth
+        c, s = np.cos(phi), np.sin(phi)
+        X = r_profile[:, None] * c[None, :]
+        Y = r_profile[:, None] * s[None, :]
+        Z = z_profile[:, None]
+
+        verts = _grid_vertices(X, Y, Z)
+
+        # Build faces (last column wraps around to the first)
+        faces = _quads_to_triangles(*_grid_quads(n_theta, n_phi, wrap=True))
+
+        mesh = trimesh.Trimesh(vertices=verts, faces=faces, process=False)
 
     elif shape == "paraboloid":
         n = 128
         phi = np.linspace(0, 2 * np.pi, n)
         r = np.linspace(0, radius_base, n)
-        R, Phi = np.meshgrid(r, phi)
+        # broadcast (1, n) radii against (n, 1) azimuths instead of materializing a meshgrid
+        R, Phi = r[None, :], phi[:, None]
 
         if position == "bottom":  # inlet
             Z = height * (R / radius_base) ** 2
@@ -131,17 +157,9 @@ def create_diffuser(shape: str, radius_base: float, radius_top: float, height: f
             raise ValueError("position must be 'bottom' or 'top'")
         X = R * np.cos(Phi)
         Y = R * np.sin(Phi)
-        verts = np.stack([X.flatten(), Y.flatten(), Z.flatten()], axis=-1)
-        faces = []
-        for i in range(n - 1):
-            for j in range(n - 1):
-                v0 = i * n + j
-                v1 = v0 + 1
-                v2 = (i + 1) * n + j + 1
-                v3 = (i + 1) * n + j
-                faces.append([v0, v1, v2])
-                faces.append([v0, v2, v3])
-        mesh = trimesh.Trimesh(vertices=verts, faces=np.array(faces))
+        verts = _grid_vertices(X, Y, Z)
+        faces = _quads_to_triangles(*_grid_quads(n, n))
+        mesh = trimesh.Trimesh(vertices=verts, faces=faces, process=False)
 
     else:
         raise ValueError(f"Unknown diffuser shape {shape}")
@@ -169,7 +187,8 @@ def assemble_pump(
     rotor_blade.generate_surface(points_per_chord=300)
 
     hub_radius = rotor_blade.hub_radius
-    rotor_span = rotor_blade.vertices_upper[:, 2].max() - rotor_blade.vertices_lower[:, 2].min()
+    z_min, z_max = rotor_blade.z_extent
+    rotor_span = z_max - z_min
     if rotor_height < rotor_span:
         raise ValueError(f"Rotor height {rotor_height} < blade span {rotor_span}")
 
@@ -190,11 +209,16 @@ def assemble_pump(
     # Vane (optional)
     vane = None
     if vane_blade_file is not None:
-        vane_blade = Blade3D.load_metadata(vane_blade_file)
+        if os.path.abspath(vane_blade_file) == os.path.abspath(rotor_blade_file):
+            # same definition: share the rotor blade and its cached surfaces/solid
+            vane_blade = rotor_blade
+        else:
+            vane_blade = Blade3D.load_metadata(vane_blade_file)
         vane_blade.generate_surface(points_per_chord=300)
         if not np.isclose(vane_blade.hub_radius, hub_radius, atol=1e-6):
             raise ValueError("Vane hub radius must equal rotor hub radius!")
-        vane_span = vane_blade.vertices_upper[:, 2].max() - vane_blade.vertices_lower[:, 2].min()
+        z_min, z_max = vane_blade.z_extent
+        vane_span = z_max - z_min
         if vane_height < vane_span:
             raise ValueError(f"Vane height {vane_height} < blade span {vane_span}")
         vane = assemble_blades_on_cylinder(
@@ -213,13 +237,14 @@ def assemble_pump(
     outlet_diffuser = create_diffuser(outlet_shape, hub_radius, outlet_shaft_radius, hub_radius, z_base=current_z, position='top')
     shaft = trimesh.creation.cylinder(radius=outlet_shaft_radius, height=outlet_shaft_length)
     shaft.apply_translation([0, 0, current_z + outlet_shaft_length / 2.0])
-    outlet = trimesh.util.concatenate([outlet_diffuser, shaft])
+    outlet = _fast_concat([outlet_diffuser, shaft])
 
     parts = {"inlet": inlet, "rotor": rotor, "outlet": outlet}
     if vane is not None:
         parts["vane"] = vane
 
-    assembly = trimesh.util.concatenate(parts.values())
+    # combine the already built parts' raw vertex/face arrays in one pass
+    assembly = _fast_concat(parts.values())
     parts["assembly"] = assembly
     return parts
 
@@ -233,7 +258,11 @@ def export_pump(meshes: dict, directory: str, export_format: str = "both"):
         os.mkdir(directory)
 
     def to_pyvista(tri: trimesh.Trimesh) -> pv.PolyData:
-        return pv.PolyData(tri.vertices, np.hstack((np.full((len(tri.faces), 1), 3), tri.faces)))
+        # PyVista cell layout [3, i, j, k, ...] written into a single buffer
+        cells = np.empty((len(tri.faces), 4), dtype=np.int64)
+        cells[:, 0] = 3
+        cells[:, 1:] = tri.faces
+        return pv.PolyData(tri.vertices, cells.reshape(-1))
 
     if export_format in {"vtk", "both"}:
         for name, mesh in meshes.items():
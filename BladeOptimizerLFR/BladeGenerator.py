@@ -6,6 +6,41 @@ import json
 import os
 from datetime import datetime
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional, the NumPy code paths are used instead
+    njit = None
+
+
+# ---------- compiled kernels (optional, numba) ----------
+def _jit(func):
+    # compiled on the first call (i.e. the first Blade3D._solid_faces("both")), not at
+    # import; cache=True keeps the machine code on disk for later runs
+    return func if njit is None else njit(cache=True, fastmath=True)(func)
+
+
+@_jit
+def _solid_faces_kernel(num_layers, N, offset, out):
+    # solid ("both") triangles written row by row into a preallocated int64 (K, 3) array,
+    # same order as Blade3D._solid_faces: upper, lower (reversed winding), side walls
+    n_grid = (num_layers - 1) * (N - 1)
+    for i in range(num_layers - 1):
+        for j in range(N - 1):
+            v0 = i * N + j
+            r_up = 2 * (i * (N - 1) + j)
+            r_lo = r_up + 2 * n_grid
+            out[r_up, 0], out[r_up, 1], out[r_up, 2] = v0, v0 + 1, v0 + N + 1
+            out[r_up + 1, 0], out[r_up + 1, 1], out[r_up + 1, 2] = v0, v0 + N + 1, v0 + N
+            w0 = v0 + offset
+            out[r_lo, 0], out[r_lo, 1], out[r_lo, 2] = w0, w0 + N + 1, w0 + 1
+            out[r_lo + 1, 0], out[r_lo + 1, 1], out[r_lo + 1, 2] = w0, w0 + N, w0 + N + 1
+    for i in range(num_layers):
+        for j in range(N - 1):
+            v0 = i * N + j
+            r = 4 * n_grid + 2 * (i * (N - 1) + j)
+            out[r, 0], out[r, 1], out[r, 2] = v0, v0 + 1, v0 + offset + 1
+            out[r + 1, 0], out[r + 1, 1], out[r + 1, 2] = v0, v0 + offset + 1, v0 + offset
+
 
 # ---------- shape primitives (gamma/tau) ----------
 def beta_distribution(x, alpha):
@@ -38,6 +73,47 @@ def beta_distribution_extended(x, alpha, kappa=1.0):
     return num / den
 
 
+def _camber_on_chord(x, alpha, kappa):
+    """
+    beta_distribution_extended evaluated in log space, for a chord row x of shape (1, N)
+    broadcast against per-layer (num_layers, 1) alpha and kappa.
+    log x and log(1-x) are taken once on the row and shared by all layers, so the two
+    fractional powers become a single exp(κ·α·log x + κ·(1-α)·log(1-x) - log den).
+    """
+    x = np.asarray(x, dtype=float)
+    with np.errstate(divide='ignore'):
+        # chord ends map to -inf, so γ_ext is exactly 0 there
+        log_x, log_1mx = np.log(x), np.log(1.0 - x)
+    eps = 1e-9
+    a = np.clip(alpha, eps, 1.0 - eps)
+    log_den = kappa * np.log((a**a) * ((1.0 - a)**(1.0 - a)) + eps)
+    # a zero exponent contributes x^0 = 1 even at the chord ends: skip 0·(-inf)
+    k_a, k_b, log_x, log_1mx = np.broadcast_arrays(kappa * a, kappa * (1.0 - a), log_x, log_1mx)
+    expo = np.multiply(k_a, log_x, out=np.zeros(k_a.shape), where=k_a != 0)
+    expo += np.multiply(k_b, log_1mx, out=np.zeros(k_b.shape), where=k_b != 0)
+    expo -= log_den
+    return np.exp(expo, out=expo)
+
+
+def _thickness_bounds(a, b):
+    """
+    Clip the ramp ends to a ∈ [0.1, 0.3], b ∈ [0.7, 0.9] and keep a <= b.
+    """
+    a = np.clip(a, 0.1, 0.3)
+    b = np.clip(b, 0.7, 0.9)
+    return np.minimum(a, b), np.maximum(a, b)
+
+
+def _tau_le(x, a, beta):
+    # leading-edge cosine ramp up on [0, a]
+    return ((1.0 - np.cos(np.pi * x / a)) / 2.0) ** beta
+
+
+def _tau_te(x, b, beta):
+    # trailing-edge cosine decay on [b, 1]
+    return ((1.0 + np.cos(np.pi * (x - b) / (1.0 - b))) / 2.0) ** beta
+
+
 def thickness_distribution(x, a=0.2, b=0.8, beta=0.3):
     """
     Basic thickness distribution τ(x).
@@ -45,25 +121,15 @@ def thickness_distribution(x, a=0.2, b=0.8, beta=0.3):
       - [0,a]: cosine ramp up
       - (a,b): flat
       - [b,1]: cosine decay
+    a, b, beta may be arrays broadcastable against x (e.g. one row per layer).
     """
-    x = np.asarray(x)
-    a = np.clip(a, 0.1, 0.3)
-    b = np.clip(b, 0.7, 0.9)
-    if not (a <= b):
-        a, b = min(a, b), max(a, b)
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 1 and np.ndim(a) == np.ndim(b) == np.ndim(beta) == 0 and np.all(np.diff(x) >= 0):
+        return _thickness_on_sorted(x, a, b, beta, out=np.empty_like(x))
+    a, b = _thickness_bounds(a, b)
 
-    tau = np.ones_like(x)
-    idx_le = x <= a
-    if a > 0:
-        tau[idx_le] = ((1.0 - np.cos(np.pi * x[idx_le] / a)) / 2.0) ** beta
-    else:
-        tau[idx_le] = 0.0
-    idx_te = x >= b
-    if b < 1.0:
-        tau[idx_te] = ((1.0 + np.cos(np.pi * (x[idx_te] - b) / (1.0 - b))) / 2.0) ** beta
-    else:
-        tau[idx_te] = 0.0
-    return tau
+    # after clipping 0 < a <= b < 1, so both ramps are well defined
+    return np.where(x >= b, _tau_te(x, b, beta), np.where(x <= a, _tau_le(x, a, beta), 1.0))
 
 
 def tapered_thickness_distribution(x, a=0.2, b=0.8, beta=0.3, taper=0.5):
@@ -77,6 +143,49 @@ def tapered_thickness_distribution(x, a=0.2, b=0.8, beta=0.3, taper=0.5):
     return base * (1.0 - taper * x)
 
 
+def _thickness_on_sorted(x, a, b, beta, out):
+    """
+    τ(x) written into out, for ascending 1D x and scalar a, b, beta.
+    On a sorted chord the piecewise masks are contiguous, so the ramps are
+    evaluated on slices only: [:i_a] holds x <= a, [i_b:] holds x >= b.
+    """
+    a, b = (float(v) for v in _thickness_bounds(a, b))
+    i_a = np.searchsorted(x, a, side='right')
+    i_b = np.searchsorted(x, b, side='left')
+    out[:] = 1.0
+    out[:i_a] = _tau_le(x[:i_a], a, beta)
+    out[i_b:] = _tau_te(x[i_b:], b, beta)
+    return out
+
+
+# ---------- mesh topology helpers ----------
+def _grid_quads(n_rows, n_cols, offset=0, wrap=False):
+    """
+    Corner indices (v0, v1, v2, v3) of every quad cell of a row-major
+    (n_rows x n_cols) vertex grid, each as an (n_rows-1, n_cols-1) array.
+    If wrap is True, the last column is stitched back to the first one
+    (n_cols quads per row).
+    """
+    i = np.arange(n_rows - 1)[:, None]
+    j = np.arange(n_cols if wrap else n_cols - 1)[None, :]
+    j1 = (j + 1) % n_cols
+    row = offset + i * n_cols
+    return row + j, row + j1, row + n_cols + j1, row + n_cols + j
+
+
+def _quads_to_triangles(v0, v1, v2, v3, flip=False):
+    """
+    Split quads into two triangles each, (v0,v1,v2) and (v0,v2,v3).
+    flip=True reverses the winding: (v0,v2,v1) and (v0,v3,v2).
+    """
+    if flip:
+        tri_a, tri_b = (v0, v2, v1), (v0, v3, v2)
+    else:
+        tri_a, tri_b = (v0, v1, v2), (v0, v2, v3)
+    tris = np.stack([np.stack(tri_a, axis=-1), np.stack(tri_b, axis=-1)], axis=-2)
+    return tris.reshape(-1, 3)
+
+
 # ---------- blade generator ----------
 class Blade3D:
     """
@@ -102,6 +211,13 @@ class Blade3D:
         self.faces_lower = None
         self.faces_center = None
 
+        # memoized geometry: key of the last generated surface, solids per mode
+        self._surface_key = None
+        self._solid_cache = {}
+        # z-extent of the generated surfaces (AABB along z)
+        self._z_min = None
+        self._z_max = None
+
         # unique timestamp for consistent filenames
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -112,74 +228,93 @@ class Blade3D:
         w = 0.0 if n <= 1 else i / (n - 1)
         return (1.0 - w) * self.hub_radius + w * self.shroud_radius
 
+    def _geometry_key(self, points_per_chord):
+        layers = tuple(tuple(sorted(prm.items())) for prm in self.layers)
+        return (layers, self.Theta, self.H, self.z0, self.hub_radius, self.shroud_radius, int(points_per_chord))
+
+    @property
+    def z_extent(self):
+        """
+        (z_min, z_max) of the upper and lower surfaces, recorded when they are generated.
+        """
+        if self.vertices_upper is None:
+            self.generate_surface()
+        return self._z_min, self._z_max
+
     def generate_surface(self, points_per_chord=300):
         """
         Generate layered blade surfaces (upper/lower/center).
+        Skipped if the surfaces already match the current parameters and resolution.
         """
+        key = self._geometry_key(points_per_chord)
+        if self.vertices_upper is not None and key == self._surface_key:
+            return
+
         num_layers = len(self.layers)
         N = int(points_per_chord)
-        xi = np.linspace(0.0, 1.0, N)
-
-        verts_upper, verts_lower, verts_center = [], [], []
-
-        for i in range(num_layers):
-            prm = self.layers[i]
-            theta0 = float(prm['theta0'])
-            h_max = float(prm['h_max'])
-            t_max = float(prm['t_max'])
-            alpha = float(prm['alpha'])
-            a = float(prm['a'])
-            b = float(prm['b'])
-            beta = float(prm['beta'])
-            mode = prm.get('mode', 'basic')
-
-            # choose gamma
-            if mode == 'extended':
-                kappa = float(prm.get('kappa', 1.5))
-                gamma = beta_distribution_extended(xi, alpha, kappa)
-            else:
-                gamma = beta_distribution(xi, alpha)
-
-            # choose tau
-            if mode == 'tapered':
-                taper = float(prm.get('taper', 0.5))
-                tau = tapered_thickness_distribution(xi, a, b, beta, taper)
-            else:
-                tau = thickness_distribution(xi, a, b, beta)
-
-            theta = theta0 + xi * self.Theta
-            z_center = self.z0 + xi * self.H - h_max * gamma
-            z_upper = z_center + t_max * tau
-            z_lower = z_center - t_max * tau
-
-            R = self._layer_radius(i, num_layers)
-            x_circ = np.cos(theta) * R
-            y_circ = np.sin(theta) * R
-
-            verts_upper.append(np.stack([x_circ, y_circ, z_upper], axis=-1))
-            verts_lower.append(np.stack([x_circ, y_circ, z_lower], axis=-1))
-            verts_center.append(np.stack([x_circ, y_circ, z_center], axis=-1))
-
-        self.vertices_upper = np.vstack(verts_upper)
-        self.vertices_lower = np.vstack(verts_lower)
-        self.vertices_center = np.vstack(verts_center)
-
-        def build_faces(verts, N, num_layers):
-            faces = []
-            for i in range(num_layers - 1):
-                base0 = i * N
-                base1 = (i + 1) * N
-                for j in range(N - 1):
-                    v0 = base0 + j
-                    v1 = base0 + j + 1
-                    v2 = base1 + j + 1
-                    v3 = base1 + j
-                    faces.append([4, v0, v1, v2, v3])
-            return np.hstack(faces).astype(np.int64)
-
-        self.faces_upper = build_faces(self.vertices_upper, N, num_layers)
-        self.faces_lower = build_faces(self.vertices_lower, N, num_layers)
-        self.faces_center = build_faces(self.vertices_center, N, num_layers)
+        xi = np.linspace(0.0, 1.0, N)[None, :]
+
+        # pack layer parameters as (num_layers, 1) columns, broadcast against xi
+        def column(values):
+            return np.array(values, dtype=float)[:, None]
+
+        modes = [prm.get('mode', 'basic') for prm in self.layers]
+        theta0 = column([prm['theta0'] for prm in self.layers])
+        h_max = column([prm['h_max'] for prm in self.layers])
+        t_max = column([prm['t_max'] for prm in self.layers])
+        alpha = column([prm['alpha'] for prm in self.layers])
+        a = column([prm['a'] for prm in self.layers])
+        b = column([prm['b'] for prm in self.layers])
+        beta = column([prm['beta'] for prm in self.layers])
+        # kappa=1 reduces the extended envelope to the basic one,
+        # taper=0 reduces the tapered thickness to the basic one
+        kappa = column([prm.get('kappa', 1.5) if m == 'extended' else 1.0 for prm, m in zip(self.layers, modes)])
+        taper = column([prm.get('taper', 0.5) if m == 'tapered' else 0.0 for prm, m in zip(self.layers, modes)])
+        R = column([self._layer_radius(i, num_layers) for i in range(num_layers)])
+
+        gamma = _camber_on_chord(xi, alpha, kappa)
+        # thickness per layer on the shared sorted chord (slice fast path), then taper
+        tau = np.empty((num_layers, N))
+        for k in range(num_layers):
+            _thickness_on_sorted(xi[0], a[k, 0], b[k, 0], beta[k, 0], out=tau[k])
+        tau *= 1.0 - taper * xi
+
+        theta = theta0 + xi * self.Theta
+        z_center = self.z0 + xi * self.H - h_max * gamma
+        z_upper = z_center + t_max * tau
+        z_lower = z_center - t_max * tau
+
+        # write straight into preallocated (num_layers, N, 3) buffers; reshape is a view
+        verts_upper = np.empty((num_layers, N, 3), dtype=np.float64)
+        np.multiply(np.cos(theta), R, out=verts_upper[:, :, 0])
+        np.multiply(np.sin(theta), R, out=verts_upper[:, :, 1])
+        verts_upper[:, :, 2] = z_upper
+
+        verts_lower = np.empty_like(verts_upper)
+        verts_lower[:, :, :2] = verts_upper[:, :, :2]
+        verts_lower[:, :, 2] = z_lower
+
+        verts_center = np.empty_like(verts_upper)
+        verts_center[:, :, :2] = verts_upper[:, :, :2]
+        verts_center[:, :, 2] = z_center
+
+        self.vertices_upper = verts_upper.reshape(-1, 3)
+        self.vertices_lower = verts_lower.reshape(-1, 3)
+        self.vertices_center = verts_center.reshape(-1, 3)
+
+        # PyVista quad layout: [4, v0, v1, v2, v3, 4, ...]
+        v0, v1, v2, v3 = _grid_quads(num_layers, N)
+        quads = np.stack([np.full_like(v0, 4), v0, v1, v2, v3], axis=-1).reshape(-1).astype(np.int64)
+
+        # all three surfaces share the same (num_layers x N) grid topology
+        self.faces_upper = quads
+        self.faces_lower = quads.copy()
+        self.faces_center = quads.copy()
+
+        self._surface_key = key
+        self._solid_cache = {}
+        self._z_min = float(min(verts_upper[..., 2].min(), verts_lower[..., 2].min()))
+        self._z_max = float(max(verts_upper[..., 2].max(), verts_lower[..., 2].max()))
 
     def to_pyvista_mesh(self, mode="both"):
         """
@@ -210,66 +345,62 @@ class Blade3D:
     def _generate_solid_from_surfaces(self, mode="both"):
         """
         Generate a solid trimesh mesh by connecting upper and lower surfaces.
+        Returns a copy of the cached solid, so callers may modify it.
+        """
+        return self._solid(mode).copy()
+
+    def _solid(self, mode="both"):
+        """
+        Solid for mode, built on first use and cached until the surfaces are regenerated.
+        The cached mesh itself is returned: callers must not modify it.
         """
         if self.vertices_upper is None:
             self.generate_surface()
+        if mode in self._solid_cache:
+            return self._solid_cache[mode]
 
         num_layers = len(self.layers)
         N = len(self.vertices_upper) // num_layers
 
         vertices = []
         if mode in ["upper", "both"]:
-            vertices.extend(self.vertices_upper.tolist())
+            vertices.append(self.vertices_upper)
         if mode in ["lower", "both"]:
-            vertices.extend(self.vertices_lower.tolist())
-        vertices = np.array(vertices)
+            vertices.append(self.vertices_lower)
+        vertices = np.concatenate(vertices, axis=0)
+        faces = self._solid_faces(mode, num_layers, N)
+
+        # generated topology is clean (no duplicate faces, every vertex referenced,
+        # side walls close the hub/shroud), so skip trimesh's processing passes
+        solid_mesh = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        self._solid_cache[mode] = solid_mesh
+        return solid_mesh
+
+    def _solid_faces(self, mode, num_layers, N):
+        """
+        Triangle indices (K, 3) of the solid built from the upper and/or lower surfaces.
+        """
+        if mode == "both" and njit is not None:
+            out = np.empty((2 * (N - 1) * (3 * num_layers - 2), 3), dtype=np.int64)
+            _solid_faces_kernel(num_layers, N, num_layers * N, out)
+            return out
 
         faces = []
         # Upper faces
         if mode in ["upper", "both"]:
-            for i in range(num_layers - 1):
-                base0 = i * N
-                base1 = (i + 1) * N
-                for j in range(N - 1):
-                    v0 = base0 + j
-                    v1 = base0 + j + 1
-                    v2 = base1 + j + 1
-                    v3 = base1 + j
-                    faces.append([v0, v1, v2])
-                    faces.append([v0, v2, v3])
-
-        # Lower faces (offset if both included)
-        offset = len(self.vertices_upper) if mode in ["both"] else 0
+            faces.append(_quads_to_triangles(*_grid_quads(num_layers, N)))
+
+        # Lower faces (offset if both included, reversed winding)
+        offset = num_layers * N if mode in ["both"] else 0
         if mode in ["lower", "both"]:
-            for i in range(num_layers - 1):
-                base0 = i * N + offset
-                base1 = (i + 1) * N + offset
-                for j in range(N - 1):
-                    v0 = base0 + j
-                    v1 = base0 + j + 1
-                    v2 = base1 + j + 1
-                    v3 = base1 + j
-                    faces.append([v0, v2, v1])
-                    faces.append([v0, v3, v2])
+            faces.append(_quads_to_triangles(*_grid_quads(num_layers, N, offset), flip=True))
 
         # Side faces
         if mode == "both":
-            for i in range(num_layers):
-                base_upper = i * N
-                base_lower = base_upper + offset
-                for j in range(N - 1):
-                    v0 = base_upper + j
-                    v1 = base_upper + j + 1
-                    v2 = base_lower + j + 1
-                    v3 = base_lower + j
-                    faces.append([v0, v1, v2])
-                    faces.append([v0, v2, v3])
-
-        solid_mesh = trimesh.Trimesh(vertices=vertices, faces=np.array(faces))
-        solid_mesh.remove_duplicate_faces()
-        solid_mesh.remove_unreferenced_vertices()
-        solid_mesh.fill_holes()
-        return solid_mesh
+            v0 = np.arange(num_layers)[:, None] * N + np.arange(N - 1)[None, :]
+            faces.append(_quads_to_triangles(v0, v0 + 1, v0 + offset + 1, v0 + offset))
+
+        return np.concatenate(faces)
 
     def save_metadata(self, filename_prefix: str):
         """